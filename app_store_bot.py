@@ -6,18 +6,66 @@ Slack Bot for monitoring App Store competitor releases
 import os
 import time
 import json
+import asyncio
 import requests
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
-import schedule
 import logging
-from typing import List, Dict, Optional
+from itertools import chain
+from typing import List, Dict, Optional, Union
 from dataclasses import dataclass
 from dotenv import load_dotenv
 from flask import Flask
 
+# aiohttp is optional - used for concurrent lookups and the async Slack
+# client, falls back to the sync requests/WebClient paths
+try:
+    import aiohttp
+    from slack_sdk.web.async_client import AsyncWebClient
+except ImportError:
+    aiohttp = None
+    AsyncWebClient = None
+
+# orjson is optional - parses/serializes JSON several times faster than stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON bytes/str with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# xxhash is optional - used to prefilter the version diff with cheap
+# 64-bit integer compares, falls back to crc32
+try:
+    import xxhash
+
+    def _version_hash(version: str) -> int:
+        return xxhash.xxh64_intdigest(version.encode('utf-8'))
+except ImportError:
+    import zlib
+
+    def _version_hash(version: str) -> int:
+        return zlib.crc32(version.encode('utf-8'))
+
+
+# Sentinel returned when the server answers 304 Not Modified - nothing
+# changed since the last fetch, so callers can skip the version diff
+UNCHANGED = object()
+
 # Load environment variables from .env file (if it exists)
 # In production (Render), environment variables are set directly
 if os.path.exists('.env'):
@@ -30,7 +78,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class AppInfo:
     """Represents an App Store app"""
     app_id: str
@@ -40,6 +88,8 @@ class AppInfo:
     last_updated: datetime
     store_url: str
     release_notes: str = ""
+    formatted_updated: str = ""
+    is_new_release: bool = False
 
 class AppStoreMonitor:
     """Monitors App Store for app updates"""
@@ -47,126 +97,358 @@ class AppStoreMonitor:
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            # Explicitly ask for compressed JSON - gzip shrinks the iTunes
+            # payload 3-5x and requests decompresses it transparently
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept': 'application/json'
         })
+        # In-process TTL cache so repeated lookups for the same app
+        # within the TTL window don't re-hit iTunes
+        self._cache: Dict[str, tuple] = {}
+        self._ttl = 900  # 15 minutes
+
+        # ETag/Last-Modified validators per request key, used for
+        # conditional GETs so unchanged responses come back as empty 304s
+        # (persisted alongside last_check.json by CompetitorMonitor)
+        self.validators: Dict[str, Dict[str, str]] = {}
+
+    def _conditional_headers(self, key: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from stored validators"""
+        headers = {}
+        stored = self.validators.get(key)
+        if stored:
+            if stored.get('etag'):
+                headers['If-None-Match'] = stored['etag']
+            if stored.get('last_modified'):
+                headers['If-Modified-Since'] = stored['last_modified']
+        return headers
+
+    def _store_validators(self, key: str, response_headers) -> None:
+        """Capture ETag/Last-Modified from a 200 response for the next poll"""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag or last_modified:
+            self.validators[key] = {'etag': etag, 'last_modified': last_modified}
+
+    def _get_cached(self, app_id: str) -> Optional[AppInfo]:
+        """Return a cached AppInfo if it is still within the TTL"""
+        entry = self._cache.get(app_id)
+        if entry and time.time() - entry[0] < self._ttl:
+            return entry[1]
+        return None
+
+    def _parse_app_data(self, app_id: str, data: dict) -> Optional[AppInfo]:
+        """Build an AppInfo from an iTunes lookup response"""
+        if data.get('resultCount', 0) == 0:
+            logger.warning(f"No app found with ID: {app_id}")
+            return None
+
+        return self._build_app_info(app_id, data['results'][0])
 
-    def get_app_info(self, app_id: str) -> Optional[AppInfo]:
+    def _build_app_info(self, app_id: str, app_data: dict) -> AppInfo:
+        """Build an AppInfo from a single iTunes result entry"""
+        # Parse release date
+        release_date = datetime.fromisoformat(
+            app_data['currentVersionReleaseDate'].replace('Z', '+00:00')
+        )
+
+        # Truncate release notes once at ingestion instead of at every
+        # notification build (Slack shows at most 500 chars anyway)
+        notes = app_data.get('releaseNotes', '') or ''
+        if len(notes) > 500:
+            notes = notes[:500] + '...'
+
+        app_info = AppInfo(
+            app_id=app_id,
+            name=app_data['trackName'],
+            developer=app_data['artistName'],
+            current_version=app_data['version'],
+            last_updated=release_date,
+            store_url=app_data['trackViewUrl'],
+            release_notes=notes,
+            formatted_updated=release_date.strftime('%Y-%m-%d %H:%M UTC')
+        )
+
+        self._cache[app_id] = (time.time(), app_info)
+        return app_info
+
+    def get_app_info(self, app_id: str, force_refresh: bool = False) -> Optional[AppInfo]:
         """
         Get app information from App Store
         Uses iTunes API which provides JSON data
+        Set force_refresh=True to bypass the TTL cache
         """
+        if not force_refresh:
+            cached = self._get_cached(app_id)
+            if cached:
+                return cached
+
         try:
             # Use iTunes lookup API
             url = f"https://itunes.apple.com/lookup?id={app_id}&country=us"
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=10,
+                                        headers=self._conditional_headers(app_id))
+
+            if response.status_code == 304:
+                # Not modified server-side - serve the cached copy even if
+                # its TTL has expired, or refetch in full if we lost it
+                entry = self._cache.get(app_id)
+                if entry:
+                    return entry[1]
+                self.validators.pop(app_id, None)
+                response = self.session.get(url, timeout=10)
+
             response.raise_for_status()
+            self._store_validators(app_id, response.headers)
 
-            data = response.json()
+            return self._parse_app_data(app_id, _json_loads(response.content))
 
-            if data.get('resultCount', 0) == 0:
-                logger.warning(f"No app found with ID: {app_id}")
-                return None
+        except Exception as e:
+            logger.error(f"Error fetching app info for {app_id}: {e}")
+            return None
 
-            app_data = data['results'][0]
+    def get_app_infos(self, app_ids: List[str],
+                      force_refresh: bool = False) -> Union[Dict[str, AppInfo], object]:
+        """
+        Look up many apps with a single iTunes request
+        The lookup endpoint accepts a comma-separated id list, so K apps
+        cost one HTTP round-trip instead of K
+        Returns the UNCHANGED sentinel when the server answers 304 and
+        every requested id was covered by the conditional request;
+        with force_refresh=False, TTL-cache hits are returned as a dict
+        even when the rest of the batch comes back 304
+        """
+        infos: Dict[str, AppInfo] = {}
+
+        remaining = list(app_ids)
+        if not force_refresh:
+            # Serve what we can from the TTL cache, fetch only the misses
+            remaining = []
+            for app_id in app_ids:
+                cached = self._get_cached(app_id)
+                if cached:
+                    infos[app_id] = cached
+                else:
+                    remaining.append(app_id)
+
+        if not remaining:
+            return infos
 
-            # Parse release date
-            release_date = datetime.fromisoformat(
-                app_data['currentVersionReleaseDate'].replace('Z', '+00:00')
-            )
+        try:
+            url = f"https://itunes.apple.com/lookup?id={','.join(remaining)}&country=us"
+            key = 'batch:' + ','.join(remaining)
+            response = self.session.get(url, timeout=10,
+                                        headers=self._conditional_headers(key))
+
+            if response.status_code == 304:
+                # Nothing changed since the last poll for this id set
+                logger.info(f"iTunes reports no changes for {len(remaining)} apps (304)")
+                # The 304 only vouches for the ids we actually requested -
+                # hand back any cache hits instead of over-claiming
+                # UNCHANGED for the whole input
+                return infos if infos else UNCHANGED
 
-            return AppInfo(
-                app_id=app_id,
-                name=app_data['trackName'],
-                developer=app_data['artistName'],
-                current_version=app_data['version'],
-                last_updated=release_date,
-                store_url=app_data['trackViewUrl'],
-                release_notes=app_data.get('releaseNotes', '')
-            )
+            response.raise_for_status()
+
+            data = _json_loads(response.content)
+
+            for app_data in data.get('results', []):
+                app_id = str(app_data['trackId'])
+                infos[app_id] = self._build_app_info(app_id, app_data)
+
+            for app_id in remaining:
+                if app_id not in infos:
+                    logger.warning(f"No app found with ID: {app_id}")
+
+            # Keep the new validators only once the payload was fully
+            # parsed - a lost body must not teach us an ETag that would
+            # 304 away the release it carried
+            self._store_validators(key, response.headers)
 
         except Exception as e:
-            logger.error(f"Error fetching app info for {app_id}: {e}")
-            return None
+            logger.error(f"Error fetching app infos for {len(remaining)} apps: {e}")
+
+        return infos
+
+    async def get_app_infos_async(self, app_ids: List[str],
+                                  force_refresh: bool = False) -> Union[Dict[str, AppInfo], object]:
+        """
+        Async batched lookup; falls back to the sync path without aiohttp
+        Same return contract as get_app_infos
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(self.get_app_infos, app_ids,
+                                           force_refresh=force_refresh)
+
+        infos: Dict[str, AppInfo] = {}
+
+        remaining = list(app_ids)
+        if not force_refresh:
+            remaining = []
+            for app_id in app_ids:
+                cached = self._get_cached(app_id)
+                if cached:
+                    infos[app_id] = cached
+                else:
+                    remaining.append(app_id)
+
+        if not remaining:
+            return infos
+
+        try:
+            url = f"https://itunes.apple.com/lookup?id={','.join(remaining)}&country=us"
+            key = 'batch:' + ','.join(remaining)
+            headers = dict(self.session.headers)
+            headers.update(self._conditional_headers(key))
+
+            connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+            async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status == 304:
+                        logger.info(f"iTunes reports no changes for {len(remaining)} apps (304)")
+                        # Same partial-hit contract as get_app_infos
+                        return infos if infos else UNCHANGED
+
+                    response.raise_for_status()
+                    data = _json_loads(await response.read())
+                    response_headers = response.headers
+
+            for app_data in data.get('results', []):
+                app_id = str(app_data['trackId'])
+                infos[app_id] = self._build_app_info(app_id, app_data)
+
+            for app_id in remaining:
+                if app_id not in infos:
+                    logger.warning(f"No app found with ID: {app_id}")
+
+            # Keep the new validators only once the payload was fully
+            # read and parsed - if the body read times out or the
+            # connection drops mid-body, retaining the new ETag would
+            # 304 away the release that payload carried until the next
+            # release changes it
+            self._store_validators(key, response_headers)
+
+        except Exception as e:
+            logger.error(f"Error fetching app infos for {len(remaining)} apps: {e}")
+
+        return infos
+
+# Precomputed templates for the Slack block hot loop - hoisted to module
+# level so each notification reuses them instead of rebuilding per app
+_APP_LHS_TMPL = "{emoji} *{name}*\n{dev}"
+_APP_RHS_TMPL = "*Version:* {ver}\n*Updated:* {upd}"
+_STORE_LINK_TMPL = "<{url}|📱 App Store>"
+_NOTES_TMPL = "*What's New:*\n```{notes}```"
+_DIVIDER_BLOCK = {"type": "divider"}
+
+
+def _build_app_blocks(app_info: AppInfo, with_divider: bool = False) -> list:
+    """Build the Slack blocks for a single app update"""
+    app_emoji = "🆕" if app_info.is_new_release else "📱"
+
+    blocks = [{
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": _APP_LHS_TMPL.format(
+                    emoji=app_emoji, name=app_info.name, dev=app_info.developer)
+            },
+            {
+                "type": "mrkdwn",
+                "text": _APP_RHS_TMPL.format(
+                    ver=app_info.current_version, upd=app_info.formatted_updated)
+            },
+            {
+                "type": "mrkdwn",
+                "text": _STORE_LINK_TMPL.format(url=app_info.store_url)
+            }
+        ]
+    }]
+
+    # Add release notes if available (already truncated at parse time)
+    if app_info.release_notes and app_info.release_notes.strip():
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": _NOTES_TMPL.format(notes=app_info.release_notes)
+            }
+        })
+
+    if with_divider:
+        blocks.append(_DIVIDER_BLOCK)
+
+    return blocks
+
 
 class SlackNotifier:
     """Handles Slack notifications"""
 
     def __init__(self, token: str, channel: str):
         self.client = WebClient(token=token)
+        self.async_client = AsyncWebClient(token=token) if AsyncWebClient else None
         self.channel = channel
 
+    def _build_message(self, updated_apps: List[AppInfo]) -> Optional[dict]:
+        """Build the consolidated chat_postMessage payload"""
+        if not updated_apps:
+            return None
+
+        # Only the header emoji depends on whether any app is a new release
+        has_new = any(app.is_new_release for app in updated_apps)
+        emoji = "🆕" if has_new else "📱"
+        title = f"{emoji} Competitor App Updates ({len(updated_apps)})"
+
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": title
+                }
+            }
+        ]
+
+        # Add each app update as a section, with dividers between apps
+        last = len(updated_apps) - 1
+        blocks.extend(chain.from_iterable(
+            _build_app_blocks(app_info, with_divider=(i != last))
+            for i, app_info in enumerate(updated_apps)
+        ))
+
+        return {
+            "channel": self.channel,
+            "text": title,
+            "blocks": blocks
+        }
+
     def send_consolidated_notification(self, updated_apps: List[AppInfo]):
         """Send consolidated notification for multiple app updates"""
         try:
-            if not updated_apps:
+            message = self._build_message(updated_apps)
+            if not message:
                 return
 
-            # Count new releases vs updates
-            new_releases = [app for app in updated_apps if hasattr(app, '_is_new_release') and app._is_new_release]
-            updates = [app for app in updated_apps if not (hasattr(app, '_is_new_release') and app._is_new_release)]
+            self.client.chat_postMessage(**message)
+            logger.info(f"Consolidated notification sent for {len(updated_apps)} app updates")
 
-            emoji = "🆕" if new_releases else "📱"
-            title = f"{emoji} Competitor App Updates ({len(updated_apps)})"
+        except SlackApiError as e:
+            logger.error(f"Error sending consolidated Slack notification: {e}")
 
-            blocks = [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": title
-                    }
-                }
-            ]
-
-            # Add each app update as a section
-            for app_info in updated_apps:
-                is_new = hasattr(app_info, '_is_new_release') and app_info._is_new_release
-                app_emoji = "🆕" if is_new else "📱"
-
-                # Create app section
-                app_section = {
-                    "type": "section",
-                    "fields": [
-                        {
-                            "type": "mrkdwn",
-                            "text": f"{app_emoji} *{app_info.name}*\n{app_info.developer}"
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": f"*Version:* {app_info.current_version}\n*Updated:* {app_info.last_updated.strftime('%Y-%m-%d %H:%M UTC')}"
-                        }
-                    ]
-                }
+    async def send_consolidated_notification_async(self, updated_apps: List[AppInfo]):
+        """Async version of send_consolidated_notification"""
+        if self.async_client is None:
+            await asyncio.to_thread(self.send_consolidated_notification, updated_apps)
+            return
 
-                # Add hyperlink to App Store (no preview)
-                app_section["fields"].append({
-                    "type": "mrkdwn",
-                    "text": f"<{app_info.store_url}|📱 App Store>"
-                })
-
-                blocks.append(app_section)
-
-                # Add release notes if available
-                if app_info.release_notes and app_info.release_notes.strip():
-                    blocks.append({
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*What's New:*\n```{app_info.release_notes[:500]}{'...' if len(app_info.release_notes) > 500 else ''}```"
-                        }
-                    })
-
-                # Add divider between apps
-                if app_info != updated_apps[-1]:
-                    blocks.append({"type": "divider"})
-
-            message = {
-                "channel": self.channel,
-                "text": title,
-                "blocks": blocks
-            }
+        try:
+            message = self._build_message(updated_apps)
+            if not message:
+                return
 
-            response = self.client.chat_postMessage(**message)
+            await self.async_client.chat_postMessage(**message)
             logger.info(f"Consolidated notification sent for {len(updated_apps)} app updates")
 
         except SlackApiError as e:
@@ -179,6 +461,10 @@ class SlackNotifier:
 class CompetitorMonitor:
     """Main bot class"""
 
+    # Bounds for the adaptive polling interval (minutes)
+    MIN_INTERVAL = 15
+    MAX_INTERVAL = 360
+
     def __init__(self):
         self.app_monitor = AppStoreMonitor()
         self.slack_notifier = SlackNotifier(
@@ -190,8 +476,23 @@ class CompetitorMonitor:
 
         # Load competitor app IDs
         self.competitors = self.load_competitors()
+
+        # Version hashes let the diff loop skip unchanged apps with a
+        # single integer compare (populated by load_last_check)
+        self.last_hashes: Dict[str, int] = {}
         self.last_versions = self.load_last_check()
 
+        # Adaptive polling state: track when each app last released and an
+        # exponential moving average of the gaps between its releases, so
+        # the check interval can follow the observed release cadence
+        self.last_update_times: Dict[str, float] = {}
+        self.update_gap_emas: Dict[str, float] = {}
+        self.current_interval = 60  # minutes
+        self._empty_checks = 0
+
+        # Only write last_check.json when versions actually changed
+        self._dirty = False
+
     def load_competitors(self) -> List[str]:
         """Load competitor app IDs from config file"""
         try:
@@ -211,21 +512,49 @@ class CompetitorMonitor:
             return []
 
     def load_last_check(self) -> Dict[str, str]:
-        """Load last known versions"""
+        """Load last known versions (migrates the old flat schema)"""
         try:
             if os.path.exists(self.last_check_file):
-                with open(self.last_check_file, 'r') as f:
-                    return json.load(f)
+                with open(self.last_check_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                if isinstance(data, dict) and 'versions' in data:
+                    # Current schema: versions + HTTP validators + hashes
+                    self.app_monitor.validators = data.get('validators', {})
+                    self.last_hashes = data.get('hashes', {})
+                    return data['versions']
+                # Old schema was a flat {app_id: version} mapping
+                return data
             return {}
         except Exception as e:
             logger.error(f"Error loading last check: {e}")
             return {}
 
     def save_last_check(self):
-        """Save current versions for next check"""
+        """Save current versions for next check (atomic, only when dirty)"""
+        if not self._dirty:
+            return
         try:
-            with open(self.last_check_file, 'w') as f:
-                json.dump(self.last_versions, f, indent=2)
+            # Write to a temp file and rename so a crash mid-write can't
+            # leave a truncated/corrupt state file behind
+            tmp = self.last_check_file + '.tmp'
+            state = {
+                'versions': self.last_versions,
+                'validators': self.app_monitor.validators,
+                'hashes': self.last_hashes
+            }
+            payload = _json_dumps(state)
+            with open(tmp, 'wb') as f:
+                f.write(payload)
+            try:
+                os.replace(tmp, self.last_check_file)
+            except OSError:
+                # last_check.json may be a single-file bind mount (see
+                # docker-compose.yml), where renaming onto it raises EBUSY -
+                # fall back to rewriting it in place
+                with open(self.last_check_file, 'wb') as f:
+                    f.write(payload)
+                os.remove(tmp)
+            self._dirty = False
         except Exception as e:
             logger.error(f"Error saving last check: {e}")
 
@@ -233,14 +562,55 @@ class CompetitorMonitor:
         """Check all competitors for updates"""
         logger.info("Starting competitor check...")
 
+        # Fetch all competitors with a single batched lookup call
+        # Scheduled runs bypass the TTL cache so updates are never missed
+        app_infos = self.app_monitor.get_app_infos(self.competitors, force_refresh=True)
+        updated_apps = self._process_app_infos(app_infos)
+
+        if updated_apps:
+            self.slack_notifier.send_consolidated_notification(updated_apps)
+            self.save_last_check()
+            logger.info(f"Found updates for {len(updated_apps)} apps - consolidated notification sent")
+
+    async def check_for_updates_async(self):
+        """Async version of check_for_updates for the event-loop scheduler"""
+        logger.info("Starting competitor check...")
+
+        app_infos = await self.app_monitor.get_app_infos_async(
+            self.competitors, force_refresh=True)
+        updated_apps = self._process_app_infos(app_infos)
+
+        if updated_apps:
+            # Overlap the Slack round-trip with the state-file write
+            await asyncio.gather(
+                self.slack_notifier.send_consolidated_notification_async(updated_apps),
+                asyncio.to_thread(self.save_last_check)
+            )
+            logger.info(f"Found updates for {len(updated_apps)} apps - consolidated notification sent")
+
+    def _process_app_infos(self, app_infos) -> List[AppInfo]:
+        """Diff fetched infos against stored versions, return the updated apps"""
         updated_apps = []
 
+        if app_infos is UNCHANGED:
+            # Server-side validators say nothing changed - skip the diff
+            logger.info("No updates found for any competitors (not modified)")
+            self._recompute_interval(False)
+            return updated_apps
+
         for app_id in self.competitors:
-            app_info = self.app_monitor.get_app_info(app_id)
+            app_info = app_infos.get(app_id)
 
             if not app_info:
                 continue
 
+            # Hash prefilter: skip the string compare for unchanged apps
+            version_hash = _version_hash(app_info.current_version)
+            if self.last_hashes.get(app_id) == version_hash:
+                logger.info(f"No update for {app_info.name} (still v{app_info.current_version})")
+                continue
+            self.last_hashes[app_id] = version_hash
+
             last_version = self.last_versions.get(app_id)
 
             if last_version != app_info.current_version:
@@ -248,23 +618,52 @@ class CompetitorMonitor:
                 is_new_release = last_version is not None
 
                 # Mark the app as new release for consolidated notification
-                app_info._is_new_release = is_new_release
+                app_info.is_new_release = is_new_release
                 updated_apps.append(app_info)
 
+                # Track release cadence for adaptive polling
+                now = time.time()
+                prev = self.last_update_times.get(app_id)
+                if prev is not None:
+                    gap = now - prev
+                    ema = self.update_gap_emas.get(app_id)
+                    self.update_gap_emas[app_id] = gap if ema is None else 0.3 * gap + 0.7 * ema
+                self.last_update_times[app_id] = now
+
                 # Update stored version
                 self.last_versions[app_id] = app_info.current_version
+                self._dirty = True
                 logger.info(f"Update found for {app_info.name}: {last_version} → {app_info.current_version}")
             else:
                 logger.info(f"No update for {app_info.name} (still v{app_info.current_version})")
 
-        # Send consolidated notification for all updates
-        if updated_apps:
-            self.slack_notifier.send_consolidated_notification(updated_apps)
-            self.save_last_check()
-            logger.info(f"Found updates for {len(updated_apps)} apps - consolidated notification sent")
-        else:
+        if not updated_apps:
             logger.info("No updates found for any competitors")
 
+        self._recompute_interval(bool(updated_apps))
+        return updated_apps
+
+    def _recompute_interval(self, found_updates: bool):
+        """Adapt the polling interval to the observed release cadence"""
+        if found_updates:
+            # Halve the interval on a hit so we track active release periods
+            self._empty_checks = 0
+            self.current_interval = max(self.MIN_INTERVAL, self.current_interval // 2)
+        else:
+            # Back off after 3 consecutive empty checks
+            self._empty_checks += 1
+            if self._empty_checks >= 3:
+                self._empty_checks = 0
+                self.current_interval = min(self.MAX_INTERVAL, self.current_interval * 2)
+
+        # Never poll slower than 1/8 of the fastest app's average release gap
+        if self.update_gap_emas:
+            cadence_cap = int(min(self.update_gap_emas.values()) / 60 / 8)
+            cadence_cap = max(self.MIN_INTERVAL, min(cadence_cap, self.MAX_INTERVAL))
+            self.current_interval = min(self.current_interval, cadence_cap)
+
+        logger.info(f"Next check in {self.current_interval} minutes")
+
 # Flask app for health checks (needed for Render deployment)
 app = Flask(__name__)
 
@@ -294,18 +693,20 @@ def start_background_monitor():
         # Initialize monitor
         monitor = CompetitorMonitor()
 
-        # Run initial check
-        monitor.check_for_updates()
-
-        # Schedule regular checks (every 1 hour)
-        schedule.every(1).hours.do(monitor.check_for_updates)
-
-        logger.info("Background monitor started. Checking for updates every 1 hour...")
-
-        # Keep running
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute for scheduled tasks
+        async def run():
+            logger.info("Background monitor started with adaptive check interval...")
+            # One event loop, one timer: check, then sleep exactly until
+            # the next adapted interval - no schedule-library polling
+            while True:
+                try:
+                    await monitor.check_for_updates_async()
+                except Exception as e:
+                    # A failed check must not kill the monitor thread while
+                    # the Flask health endpoint keeps reporting healthy
+                    logger.error(f"Competitor check failed: {e}")
+                await asyncio.sleep(monitor.current_interval * 60)
+
+        asyncio.run(run())
 
     # Start monitoring in background thread
     monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
@@ -7,8 +7,18 @@ import os
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+def _probe_tool(tool):
+    """Check whether a tool responds to --version"""
+    try:
+        subprocess.run([tool, '--version'], capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
 def check_requirements():
     """Check if required tools are installed"""
     required_tools = ['python3', 'pip']
@@ -16,22 +26,27 @@ def check_requirements():
 
     print("🔍 Checking system requirements...")
 
+    # Probe all tools in parallel - each probe is a subprocess wait,
+    # so running them concurrently collapses the total wall time
+    all_tools = required_tools + optional_tools
+    with ThreadPoolExecutor(max_workers=len(all_tools)) as executor:
+        results = dict(zip(all_tools, executor.map(_probe_tool, all_tools)))
+
+    ok = True
     for tool in required_tools:
-        try:
-            subprocess.run([tool, '--version'], capture_output=True, check=True)
+        if results[tool]:
             print(f"✅ {tool} - OK")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             print(f"❌ {tool} - MISSING (required)")
-            return False
+            ok = False
 
     for tool in optional_tools:
-        try:
-            subprocess.run([tool, '--version'], capture_output=True, check=True)
+        if results[tool]:
             print(f"✅ {tool} - OK")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             print(f"⚠️  {tool} - Not found (optional)")
 
-    return True
+    return ok
 
 def setup_environment():
     """Set up environment variables"""
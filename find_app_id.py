@@ -7,12 +7,27 @@ import requests
 import sys
 import json
 from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so repeated lookups reuse the same TCP/TLS connection
+# to itunes.apple.com instead of paying the handshake cost per call
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
 
 def get_app_info(app_id: str) -> Optional[dict]:
     """Get app information from App Store using iTunes API"""
     try:
         url = f"https://itunes.apple.com/lookup?id={app_id}&country=us"
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=(3.05, 10))
         response.raise_for_status()
 
         data = response.json()
@@ -40,7 +55,7 @@ def search_apps_by_name(app_name: str) -> list:
         encoded_name = quote(app_name)
 
         url = f"https://itunes.apple.com/search?term={encoded_name}&country=us&entity=software"
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=(3.05, 10))
         response.raise_for_status()
 
         data = response.json()